@@ -20,7 +20,7 @@
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
-import sys, random, time, math
+import sys, random, time, math, ctypes
 
 
 # -------- Window / Scene ----------
@@ -37,6 +37,8 @@ cam_angle = 45.0          # orbit around Y (degrees)
 cam_tilt  = 30.0          # tilt (degrees)
 cam_dist  = 16.0          # radius
 top_down  = False
+cam_eye   = (0.0, 0.0, 0.0)  # orbit eye position, recomputed when cam_dirty
+cam_dirty = True
 
 # -------- Game State ----------
 players = [
@@ -54,11 +56,25 @@ animating = False
 anim_mode = None      # None, 'steps', 'snake', 'ladder'
 anim_path = []        # for 'steps': list of (from,to); for snake/ladder: list of world points
 anim_t = 0.0          # 0..1 within current animation segment
+anim_dest_cell = None # for snake/ladder: cell the token ends on
 anim_speed = 2.5      # base speed (units per second for squares); adjusted per mode
 
 # Dice
 last_rolls = []
 double_dice = False   # feature (D) toggle
+DICE_SIZE = 0.6       # half-extent of a die
+_s = 0.3
+# pip (x, z) offsets on the top face, indexed by pip count 1..6
+DICE_PIP_LAYOUTS = (
+    (),
+    ((0,0),),
+    ((-_s,-_s),(_s,_s)),
+    ((-_s,-_s),(0,0),(_s,_s)),
+    ((-_s,-_s),(-_s,_s),(_s,-_s),(_s,_s)),
+    ((-_s,-_s),(-_s,_s),(0,0),(_s,-_s),(_s,_s)),
+    ((-_s,-_s),(-_s,0),(-_s,_s),(_s,-_s),(_s,0),(_s,_s)),
+)
+del _s
 
 # Bonus tiles (extra features)
 # Format: cell: ("type", value)
@@ -80,11 +96,35 @@ THEMES = [
 theme_idx = 0
 
 # Time
-last_time = time.time()
+last_time = time.monotonic()
+IDLE_FRAME_TIME = 1.0 / 60.0   # redraw pacing while nothing is moving
 
-# GLU quadric for fallback cylinder
-quadric = None
-have_glut_cylinder = hasattr(glutSolidCylinder, "__call__")
+# Unit cylinder mesh (radius 1, z from 0 to 1, capped), built in init_gl
+cylinder_vbo = None
+cylinder_verts = 0
+
+# Board tiles VBO: 100 quads, interleaved (x,y,z, r,g,b) per vertex
+board_vbo = None
+board_dirty = True        # re-upload tile colors (theme changed)
+BOARD_VERTS = BOARD_N * BOARD_N * 4
+BONUS_COLOR = (0.9, 0.9, 0.5)
+
+# Display list holding the static scene (tiles, walls, snakes, ladders)
+scene_list = None
+
+# Snake bodies: head cell -> (vbo, vertex count), world-space colored triangles
+snake_meshes = {}
+
+# Cell number labels: one display list per cell (raster pos + glyph bitmaps)
+label_base = None
+
+# HUD font: display list base for GLUT_BITMAP_HELVETICA_18 glyphs
+hud_font_base = None
+
+# Dice pip mesh (sphere triangles, positions only), built in init_gl
+pip_vbo = None
+pip_verts = 0
+PIP_RADIUS = 0.1
 
 # ---------- Snakes & Ladders Layout ----------
 LADDERS = {
@@ -112,6 +152,11 @@ SNAKES = {
     99: 80
 }
 
+# Per-cell lookup tables indexed by cell number (-1 = no snake/ladder)
+SNAKE_DEST  = tuple(SNAKES.get(c, -1) for c in range(BOARD_N*BOARD_N + 1))
+LADDER_DEST = tuple(LADDERS.get(c, -1) for c in range(BOARD_N*BOARD_N + 1))
+BONUS_MASK  = tuple(c in BONUS_TILES for c in range(BOARD_N*BOARD_N + 1))
+
 # ---------- Utilities ----------
 def clamp(v, a, b): 
     return max(a, min(b, v))
@@ -134,6 +179,9 @@ def cell_to_world(n):
     i, j = cell_to_ij(n)
     return ij_to_world(i, j)
 
+# (x, z) center of every cell, indexed by cell number (index 0 clamps to cell 1)
+CELL_XZ = tuple(cell_to_world(c) for c in range(BOARD_N*BOARD_N + 1))
+
 def make_step_path(start_cell, end_cell):
     path = []
     c = start_cell
@@ -158,14 +206,69 @@ def schedule_move(player_index, roll):
     anim_t = 0.0
     anim_mode = 'steps'
 
+# ---------- Meshes ----------
+def sphere_triangles(radius, slices, stacks):
+    # returns list of (x,y,z) triangle vertices of a sphere centered at origin
+    rings = []
+    for k in range(stacks+1):
+        phi = math.pi * k / stacks
+        y = radius * math.cos(phi)
+        rr = radius * math.sin(phi)
+        rings.append([(rr*math.cos(2*math.pi*s/slices), y, rr*math.sin(2*math.pi*s/slices))
+                      for s in range(slices+1)])
+    tris = []
+    for k in range(stacks):
+        for s in range(slices):
+            a, b = rings[k][s], rings[k][s+1]
+            c, d = rings[k+1][s], rings[k+1][s+1]
+            tris.extend((a, c, b, b, c, d))
+    return tris
+
+def make_vbo(data):
+    # uploads a flat list of floats into a new static buffer
+    arr = (GLfloat * len(data))(*data)
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, arr, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    return vbo
+
+def cylinder_triangles(slices):
+    # returns (x,y,z) triangle vertices of a capped unit cylinder along +z
+    ring = [(math.cos(2*math.pi*s/slices), math.sin(2*math.pi*s/slices)) for s in range(slices+1)]
+    tris = []
+    for s in range(slices):
+        (ax, ay), (bx, by) = ring[s], ring[s+1]
+        tris.extend(((ax, ay, 0.0), (bx, by, 0.0), (ax, ay, 1.0),
+                     (bx, by, 0.0), (bx, by, 1.0), (ax, ay, 1.0)))
+        tris.extend(((0.0, 0.0, 0.0), (bx, by, 0.0), (ax, ay, 0.0)))
+        tris.extend(((0.0, 0.0, 1.0), (ax, ay, 1.0), (bx, by, 1.0)))
+    return tris
+
+def init_cylinder_mesh():
+    global cylinder_vbo, cylinder_verts
+    tris = cylinder_triangles(20)
+    cylinder_vbo = make_vbo([f for v in tris for f in v])
+    cylinder_verts = len(tris)
+
+def init_pip_mesh():
+    global pip_vbo, pip_verts
+    tris = sphere_triangles(PIP_RADIUS, 12, 10)
+    pip_vbo = make_vbo([f for v in tris for f in v])
+    pip_verts = len(tris)
+
 # ---------- Drawing ----------
-def draw_square():
-    glBegin(GL_QUADS)
-    glVertex3f(-0.5, 0.0, -0.5)
-    glVertex3f( 0.5, 0.0, -0.5)
-    glVertex3f( 0.5, 0.0,  0.5)
-    glVertex3f(-0.5, 0.0,  0.5)
-    glEnd()
+def draw_colored_vbo(vbo, count, mode=GL_QUADS):
+    # draws an interleaved (x,y,z, r,g,b) float buffer
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 24, ctypes.c_void_p(0))
+    glColorPointer(3, GL_FLOAT, 24, ctypes.c_void_p(12))
+    glDrawArrays(mode, 0, count)
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
 
 def draw_cuboid(wx, wy, wz):
     glPushMatrix()
@@ -173,53 +276,58 @@ def draw_cuboid(wx, wy, wz):
     glutSolidCube(1.0)
     glPopMatrix()
 
-def draw_cylinder(radius, height, slices=20, stacks=4):
+def draw_mesh(vbo, count, mode=GL_TRIANGLES):
+    # draws a position-only float buffer
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+    glDrawArrays(mode, 0, count)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+def draw_cylinder(radius, height):
     glPushMatrix()
     glRotatef(-90, 1,0,0)
-    if have_glut_cylinder:
-        glutSolidCylinder(radius, height, slices, stacks)
-    else:
-        gluCylinder(quadric, radius, radius, height, slices, stacks)
-        gluDisk(quadric, 0.0, radius, slices, 1)
-        glTranslatef(0,0,height)
-        gluDisk(quadric, 0.0, radius, slices, 1)
+    glScalef(radius, radius, height)
+    draw_mesh(cylinder_vbo, cylinder_verts)
     glPopMatrix()
 
-def draw_board():
-    global theme_idx
+def board_vertex_data():
     light, dark, border = THEMES[theme_idx]
-    glPushMatrix()
-    glTranslatef(0, BOARD_Y, 0)
+    h = SQ / 2.0
+    data = []
     for i in range(BOARD_N):
         for j in range(BOARD_N):
             x, z = ij_to_world(i, j)
-            glPushMatrix()
-            glTranslatef(x, 0.0, z)
-            glScalef(SQ, 1.0, SQ)
-            c = (i + j) % 2
-            
-            # if bonus tile, tint it
             cell_num = i*BOARD_N + (j if (i%2==0) else (BOARD_N-1-j)) + 1
-            if cell_num in BONUS_TILES:
-                # brighter highlight
-                bc = (0.9, 0.9, 0.5)
-                glColor3f(*bc)
+            # bonus tiles get a brighter highlight baked in
+            if BONUS_MASK[cell_num]:
+                col = BONUS_COLOR
             else:
-                glColor3f(*(light if c==0 else dark))
-            draw_square()
-            cell_num = i*BOARD_N + (j if (i%2==0) else (BOARD_N-1-j)) + 1
-            # Check if player is on this cell
-            color = (0,0,0)
-            for idx, p in enumerate(players):
-                if p["pos"] == cell_num:
-                    color = p["color"]
-            # Draw number
-            glColor3f(*color)
-            glRasterPos3f(0, 0.01, 0)  # small offset above the square
-            for ch in str(cell_num):
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(ch))
-            
-            glPopMatrix()
+                col = light if (i + j) % 2 == 0 else dark
+            for vx, vz in ((x-h, z-h), (x+h, z-h), (x+h, z+h), (x-h, z+h)):
+                data.extend((vx, BOARD_Y, vz) + col)
+    return (GLfloat * len(data))(*data)
+
+def upload_board():
+    # create the tile VBO once; afterwards only overwrite its contents
+    global board_vbo, board_dirty
+    data = board_vertex_data()
+    if board_vbo is None:
+        board_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, board_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data, GL_STATIC_DRAW)
+    else:
+        glBindBuffer(GL_ARRAY_BUFFER, board_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, data)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    board_dirty = False
+
+def draw_board():
+    light, dark, border = THEMES[theme_idx]
+    draw_colored_vbo(board_vbo, BOARD_VERTS)
+    glPushMatrix()
+    glTranslatef(0, BOARD_Y, 0)
     # Border walls
     wall_h = 0.2
     wall_t = 0.05
@@ -230,6 +338,28 @@ def draw_board():
     glPushMatrix(); glTranslatef(BOARD_MIN, wall_h/2, 0); draw_cuboid(wall_t, wall_h, BOARD_SIZE+0.1); glPopMatrix()
     glPopMatrix()
 
+def build_cell_labels():
+    # bake each cell's number bitmaps once; color is latched at call time
+    global label_base
+    label_base = glGenLists(BOARD_N*BOARD_N)
+    for cell_num in range(1, BOARD_N*BOARD_N + 1):
+        x, z = CELL_XZ[cell_num]
+        glNewList(label_base + cell_num - 1, GL_COMPILE)
+        glRasterPos3f(x, BOARD_Y + 0.01, z)  # small offset above the square
+        for ch in str(cell_num):
+            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(ch))
+        glEndList()
+
+def draw_cell_numbers():
+    # numbers change color with the players, so they stay out of the scene list
+    pos_color = {p["pos"]: p["color"] for p in players}
+    # plain cells in black with a single call, then the player-colored ones
+    glColor3f(0, 0, 0)
+    glCallLists([label_base + c - 1 for c in range(1, BOARD_N*BOARD_N + 1) if c not in pos_color])
+    for cell_num, color in pos_color.items():
+        glColor3f(*color)
+        glCallList(label_base + cell_num - 1)
+
 def draw_token_at(world_x, world_z, color, scale=0.18, y_offset=0.25):
     glPushMatrix()
     glTranslatef(world_x, BOARD_Y + y_offset, world_z)
@@ -240,36 +370,41 @@ def draw_token_at(world_x, world_z, color, scale=0.18, y_offset=0.25):
     glPopMatrix()
 
 def draw_token(cell, color):
-    x, z = cell_to_world(cell)
+    x, z = CELL_XZ[cell]
     draw_token_at(x, z, color)
 
-def draw_snake_line(from_cell, to_cell, col=(0.2, 0.8, 0.2)):
-    x1, z1 = cell_to_world(from_cell)
-    x2, z2 = cell_to_world(to_cell)
+def snake_body_data(from_cell, to_cell, col=(0.2, 0.8, 0.2)):
+    # world-space (x,y,z, r,g,b) triangles for a snake's spheres + head
+    x1, z1 = CELL_XZ[from_cell]
+    x2, z2 = CELL_XZ[to_cell]
     dx, dz = x2 - x1, z2 - z1
     segs = 14
-    glColor3f(*col)
+    body = sphere_triangles(1.0, 16, 10)
+    data = []
     for k in range(segs+1):
         t = k / float(segs)
-        ox = -dz * 0.07 * math.sin(t*math.pi*2)
-        oz =  dx * 0.07 * math.sin(t*math.pi*2)
+        wave = math.sin(t*math.pi*2)
+        ox = -dz * 0.07 * wave
+        oz =  dx * 0.07 * wave
         x = x1 + dx*t + ox
+        y = BOARD_Y + 0.12 + 0.03*wave
         z = z1 + dz*t + oz
-        glPushMatrix()
-        glTranslatef(x, BOARD_Y + 0.12 + 0.03*math.sin(t*math.pi*2), z)
         r = 0.10 + 0.03*math.sin(t*math.pi)
-        glutSolidSphere(r, 16, 10)
-        glPopMatrix()
-    glPushMatrix()
-    glTranslatef(x1, BOARD_Y + 0.25, z1)
-    glColor3f(0.1,0.6,0.1)
-    glutSolidSphere(0.22, 16, 12)
-    glPopMatrix()
+        for vx, vy, vz in body:
+            data.extend((x + r*vx, y + r*vy, z + r*vz) + col)
+    for vx, vy, vz in sphere_triangles(0.22, 16, 12):
+        data.extend((x1 + vx, BOARD_Y + 0.25 + vy, z1 + vz, 0.1, 0.6, 0.1))
+    return data
+
+def init_snake_meshes():
+    for head, tail in SNAKES.items():
+        data = snake_body_data(head, tail)
+        snake_meshes[head] = (make_vbo(data), len(data) // 6)
 
 
 def draw_ladder(from_cell, to_cell, col=(0.7,0.5,0.2)):
-    x1, z1 = cell_to_world(from_cell)
-    x2, z2 = cell_to_world(to_cell)
+    x1, z1 = CELL_XZ[from_cell]
+    x2, z2 = CELL_XZ[to_cell]
     y = BOARD_Y + 0.05
     glColor3f(*col)
     def rail(px, pz, qx, qz, spacing):
@@ -304,11 +439,23 @@ def draw_ladder(from_cell, to_cell, col=(0.7,0.5,0.2)):
     rail(x1, z1, x2, z2, spacing=-0.12)
 
 def draw_all_snakes_ladders():
-    for head, tail in SNAKES.items():
-        draw_snake_line(head, tail)
+    for head in SNAKES:
+        vbo, count = snake_meshes[head]
+        draw_colored_vbo(vbo, count, GL_TRIANGLES)
     for base, top in LADDERS.items():
         draw_ladder(base, top)
 
+def build_static_scene():
+    # (re)compile board + snakes + ladders; called at init and on theme change
+    global scene_list
+    upload_board()
+    if scene_list is None:
+        scene_list = glGenLists(1)
+    glNewList(scene_list, GL_COMPILE)
+    draw_board()
+    draw_all_snakes_ladders()
+    glEndList()
+
 
 def draw_dice_preview():
     if not last_rolls:
@@ -318,8 +465,9 @@ def draw_dice_preview():
     dx0 = BOARD_MAX + 1.5
     dz  = (BOARD_MIN + BOARD_MAX) / 2.0
     dy  = 0.8
-    size = 0.6
+    size = DICE_SIZE
     spacing = 1.3  # space between dice
+    pips = []
 
     for idx, val in enumerate(last_rolls):
         glPushMatrix()
@@ -329,48 +477,51 @@ def draw_dice_preview():
         glColor3f(0.95, 0.95, 0.95)
         draw_cuboid(size*2, size*2, size*2)
 
-        # Draw pips on top face
-        glColor3f(0.1, 0.1, 0.1)
-        s = 0.3
-        layouts = {
-            1:[(0,0)],
-            2:[(-s,-s),(s,s)],
-            3:[(-s,-s),(0,0),(s,s)],
-            4:[(-s,-s),(-s,s),(s,-s),(s,s)],
-            5:[(-s,-s),(-s,s),(0,0),(s,-s),(s,s)],
-            6:[(-s,-s),(-s,0),(-s,s),(s,-s),(s,0),(s,s)],
-        }
-        for px, pz in layouts[val]:
-            glPushMatrix()
-            glTranslatef(px, size + 0.01, pz)
-            glutSolidSphere(0.1, 12, 10)
-            glPopMatrix()
+        # Collect pips on top face (drawn below in one batch)
+        pips.extend((dx0 + px, dy + size + 0.01, dz + idx * spacing + pz)
+                    for px, pz in DICE_PIP_LAYOUTS[val])
 
         glPopMatrix()
 
+    # all pips share one sphere mesh; walk the modelview from pip to pip
+    glColor3f(0.1, 0.1, 0.1)
+    glBindBuffer(GL_ARRAY_BUFFER, pip_vbo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+    glPushMatrix()
+    lx = ly = lz = 0.0
+    for x, y, z in pips:
+        glTranslatef(x - lx, y - ly, z - lz)
+        glDrawArrays(GL_TRIANGLES, 0, pip_verts)
+        lx, ly, lz = x, y, z
+    glPopMatrix()
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
 # ---------- Advanced Animation Helpers ----------
 def make_snake_curve(from_cell, to_cell, segs=60):
     # returns list of (x,y,z) world points along a wavy curve from head->tail
-    x1, z1 = cell_to_world(from_cell)
-    x2, z2 = cell_to_world(to_cell)
+    x1, z1 = CELL_XZ[from_cell]
+    x2, z2 = CELL_XZ[to_cell]
     dx, dz = x2 - x1, z2 - z1
     pts = []
     for k in range(segs+1):
         t = k / float(segs)
+        wave = math.sin(t * math.pi * 2)
         # base linear
         x = x1 + dx * t
         z = z1 + dz * t
         # curve offset orthogonal
-        ox = -dz * 0.12 * math.sin(t * math.pi * 2)
-        oz =  dx * 0.12 * math.sin(t * math.pi * 2)
+        ox = -dz * 0.12 * wave
+        oz =  dx * 0.12 * wave
         y = 0.12 + 0.08 * math.sin(t * math.pi)
         pts.append((x + ox, BOARD_Y + y, z + oz))
     return pts
 
 def make_ladder_path(from_cell, to_cell, rung_count=6):
     # returns path points going up rung by rung along ladder center
-    x1, z1 = cell_to_world(from_cell)
-    x2, z2 = cell_to_world(to_cell)
+    x1, z1 = CELL_XZ[from_cell]
+    x2, z2 = CELL_XZ[to_cell]
     pts = []
     for r in range(rung_count+1):
         t = r / float(rung_count)
@@ -380,38 +531,68 @@ def make_ladder_path(from_cell, to_cell, rung_count=6):
         pts.append((x, y, z))
     return pts
 
+def lerp_path(pts, t):
+    # point at fraction t (0..1) along a polyline of (x,y,z) points
+    total = len(pts)
+    idxf = t * (total - 1)
+    i0 = int(clamp(math.floor(idxf), 0, total-1))
+    i1 = min(i0 + 1, total-1)
+    ft = idxf - i0
+    x0,y0,z0 = pts[i0]; x1,y1,z1 = pts[i1]
+    return x0 + (x1-x0)*ft, y0 + (y1-y0)*ft, z0 + (z1-z0)*ft
+
+# Snakes and ladders are fixed, so their animation paths are built once
+SNAKE_CURVES = {head: tuple(make_snake_curve(head, tail, segs=80)) for head, tail in SNAKES.items()}
+LADDER_PATHS = {base: tuple(make_ladder_path(base, top, rung_count=6)) for base, top in LADDERS.items()}
+
 # ---------- Game / Animation ----------
 def apply_snake_or_ladder(cell):
-    if cell in SNAKES: return SNAKES[cell], 'snake'
-    if cell in LADDERS: return LADDERS[cell], 'ladder'
+    if SNAKE_DEST[cell] >= 0: return SNAKE_DEST[cell], 'snake'
+    if LADDER_DEST[cell] >= 0: return LADDER_DEST[cell], 'ladder'
     return cell, None
 
-def on_step_finished():
-    global animating, anim_path, anim_t, anim_mode, current_player
+def landing_effects(cell):
+    # effects of landing on cell, in the order they apply
+    dest, mode = apply_snake_or_ladder(cell)
+    if mode:
+        return [(mode, dest)]
+    effects = []
+    if BONUS_MASK[cell]:
+        effects.append(BONUS_TILES[cell])
+    effects.append(('end_turn', None))
+    return effects
+
+def resolve_landing():
+    # Work through the current player's landing effects. An effect that
+    # needs an animation starts it and returns; update_animation calls back
+    # in here when it finishes, so chained effects never nest on the stack.
+    global animating, anim_path, anim_t, anim_mode, anim_dest_cell
     p = players[current_player]
-    final_cell = p["pos"]
-    # apply bonus tiles first? We'll apply snakes/ladders then bonus tiles
-    new_cell, mode = apply_snake_or_ladder(final_cell)
-    if mode == 'snake':
-        # prepare snake curve animation from head(final_cell) to tail(new_cell)
-        anim_mode = 'snake'
-        anim_path = make_snake_curve(final_cell, new_cell, segs=80)
-        animating = True
-        anim_t = 0.0
-    elif mode == 'ladder':
-        anim_mode = 'ladder'
-        anim_path = make_ladder_path(final_cell, new_cell, rung_count=6)
-        animating = True
-        anim_t = 0.0
-    else:
-        # check bonus tiles
-        if final_cell in BONUS_TILES:
-            btype, val = BONUS_TILES[final_cell]
-            handle_bonus_tile(btype, val)
-            # if extra_roll we leave turn unchanged (player will roll again)
-            if btype == 'extra_roll':
+    pending = landing_effects(p["pos"])
+    while pending:
+        btype, val = pending.pop(0)
+        if btype in ('snake', 'ladder'):
+            # slide head->tail / climb base->top
+            anim_mode = btype
+            anim_path = SNAKE_CURVES[p["pos"]] if btype == 'snake' else LADDER_PATHS[p["pos"]]
+            anim_dest_cell = val
+            animating = True
+            anim_t = 0.0
+            return
+        elif btype == 'extra_roll':
+            # turn stays unchanged (player will roll again)
+            return
+        elif btype == 'forward':
+            anim_path = make_step_path(p["pos"], clamp(p["pos"] + val, 1, 100))
+            anim_mode = 'steps'
+            anim_t = 0.0
+            if anim_path:
+                animating = True
                 return
-        end_turn_or_win()
+        elif btype == 'skip':
+            p['skip'] = True
+        elif btype == 'end_turn':
+            end_turn_or_win()
 
       
 def preview_dice():
@@ -421,23 +602,6 @@ def preview_dice():
     else:
         last_rolls = [random.randint(1,6)]
 
-def handle_bonus_tile(btype, val):
-    global last_roll, animating, anim_path, anim_t
-    if btype == 'extra_roll':
-        # immediately allow another roll (no movement scheduled)
-        pass
-    elif btype == 'forward':
-        p = players[current_player]
-        start = p["pos"]
-        target = clamp(start + val, 1, 100)
-        anim_path = make_step_path(start, target)
-        animating = len(anim_path) > 0
-        anim_mode = 'steps'
-        anim_t = 0.0
-    elif btype == 'skip':
-        players[current_player]['skip'] = True
-
-
 def end_turn_or_win():
     global current_player, game_over, winner, two_players
     p = players[current_player]
@@ -463,7 +627,7 @@ def update_animation(dt):
     if anim_mode == 'steps':
         if not anim_path:
             animating = False
-            on_step_finished()
+            resolve_landing()
             return
         frm, to = anim_path[0]
         anim_t += anim_speed * dt
@@ -473,7 +637,7 @@ def update_animation(dt):
             anim_path.pop(0)
             if not anim_path:
                 animating = False
-                on_step_finished()
+                resolve_landing()
                 return
     elif anim_mode == 'snake':
         # anim_path is list of world points; we move along them
@@ -484,21 +648,10 @@ def update_animation(dt):
         idx_int = int(idxf)
         if idx_int >= len(anim_path)-1:
             # finish: set player pos to tail cell
-            # find tail cell from last world point -> map to nearest cell
-            tail_world = anim_path[-1]
-            # nearest cell number
-            # naive: find cell whose world coords match tail approx
-            # compute all cell centers and pick closest
-            best = None; bestd = 1e9; bestcell = players[current_player]["pos"]
-            for c in range(1, 101):
-                wx, wz = cell_to_world(c)
-                d = (wx - tail_world[0])**2 + (wz - tail_world[2])**2
-                if d < bestd:
-                    bestd = d; bestcell = c
-            players[current_player]["pos"] = bestcell
+            players[current_player]["pos"] = anim_dest_cell
             animating = False
             anim_mode = None
-            on_step_finished()
+            resolve_landing()
             return
     elif anim_mode == 'ladder':
         # climb rung-by-rung
@@ -509,20 +662,23 @@ def update_animation(dt):
         idx_int = int(idxf)
         if idx_int >= len(anim_path)-1:
             # finish: set pos to top cell
-            top_world = anim_path[-1]
-            best = None; bestd = 1e9; bestcell = players[current_player]["pos"]
-            for c in range(1, 101):
-                wx, wz = cell_to_world(c)
-                d = (wx - top_world[0])**2 + (wz - top_world[2])**2
-                if d < bestd:
-                    bestd = d; bestcell = c
-            players[current_player]["pos"] = bestcell
+            players[current_player]["pos"] = anim_dest_cell
             animating = False
             anim_mode = None
-            on_step_finished()
+            resolve_landing()
             return
 
 
+def update_camera_eye():
+    global cam_eye, cam_dirty
+    ang = math.radians(cam_angle)
+    tilt = math.radians(cam_tilt)
+    ex = math.cos(ang) * math.cos(tilt) * cam_dist
+    ez = math.sin(ang) * math.cos(tilt) * cam_dist
+    ey = math.sin(tilt) * cam_dist
+    cam_eye = (ex, ey, ez)
+    cam_dirty = False
+
 def display():
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
     glMatrixMode(GL_PROJECTION)
@@ -539,30 +695,19 @@ def display():
         up  = (0, 1, 0)
         gluLookAt(eye[0],eye[1],eye[2], at[0],at[1],at[2], up[0],up[1],up[2])
     else:
-        ang = math.radians(cam_angle)
-        tilt = math.radians(cam_tilt)
-        ex = math.cos(ang) * math.cos(tilt) * cam_dist
-        ez = math.sin(ang) * math.cos(tilt) * cam_dist
-        ey = math.sin(tilt) * cam_dist
+        if cam_dirty:
+            update_camera_eye()
+        ex, ey, ez = cam_eye
         gluLookAt(ex, ey, ez, cx, 0.0, cz, 0,1,0)
 
-    draw_board()
-    draw_all_snakes_ladders()
+    if board_dirty:
+        build_static_scene()
+    glCallList(scene_list)
+    draw_cell_numbers()
     
     if game_over:
         msg = f"Winner: Player {winner+1}!"
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, W_WIDTH, 0, W_HEIGHT)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
         draw_text(W_WIDTH//2 - 60, W_HEIGHT - 40, msg, players[winner]["color"])
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
 
 
     # Draw static tokens
@@ -570,10 +715,10 @@ def display():
         # if current player and animating in 'steps', token drawn static at last confirmed pos
         if game_over and winner == idx:
             # winner celebration: spin + bounce
-            t = time.time()
+            t = time.monotonic()
             bounce = 0.15 * abs(math.sin(t * 6.0))
             spin = (t * 360.0) % 360.0
-            x, z = cell_to_world(p["pos"])
+            x, z = CELL_XZ[p["pos"]]
             glPushMatrix()
             glTranslatef(x, BOARD_Y + 0.25 + bounce, z)
             glRotatef(spin, 0,1,0)
@@ -587,32 +732,15 @@ def display():
     if animating:
         if anim_mode == 'steps' and anim_path:
             frm, to = anim_path[0]
-            x0, z0 = cell_to_world(frm)
-            x1, z1 = cell_to_world(to)
+            x0, z0 = CELL_XZ[frm]
+            x1, z1 = CELL_XZ[to]
             x = x0 + (x1 - x0) * anim_t
             z = z0 + (z1 - z0) * anim_t
             draw_token_at(x, z, players[current_player]["color"])
-        elif anim_mode == 'snake' and anim_path:
+        elif anim_mode in ('snake', 'ladder') and len(anim_path) >= 2:
             # move along anim_path points using anim_t
-            total = len(anim_path)
-            if total >= 2:
-                idxf = anim_t * (total - 1)
-                i0 = int(clamp(math.floor(idxf), 0, total-1))
-                i1 = min(i0 + 1, total-1)
-                ft = idxf - i0
-                x0,y0,z0 = anim_path[i0]; x1,y1,z1 = anim_path[i1]
-                x = x0 + (x1-x0)*ft; y = y0 + (y1-y0)*ft; z = z0 + (z1-z0)*ft
-                draw_token_at(x, z, players[current_player]["color"], y_offset=0.0, scale=0.16)
-        elif anim_mode == 'ladder' and anim_path:
-            total = len(anim_path)
-            if total >= 2:
-                idxf = anim_t * (total - 1)
-                i0 = int(clamp(math.floor(idxf), 0, total-1))
-                i1 = min(i0 + 1, total-1)
-                ft = idxf - i0
-                x0,y0,z0 = anim_path[i0]; x1,y1,z1 = anim_path[i1]
-                x = x0 + (x1-x0)*ft; y = y0 + (y1-y0)*ft; z = z0 + (z1-z0)*ft
-                draw_token_at(x, z, players[current_player]["color"], y_offset=0.0, scale=0.16)
+            x, y, z = lerp_path(anim_path, anim_t)
+            draw_token_at(x, z, players[current_player]["color"], y_offset=0.0, scale=0.16)
 
     draw_dice_preview()
     draw_status_plates()
@@ -635,26 +763,23 @@ def draw_status_plates():
     glPopMatrix()
 
 def idle():
-    global last_time, anim_t
-    now = time.time()
+    global last_time
+    now = time.monotonic()
+    if not animating and not game_over:
+        # board is waiting for input: sleep out the frame instead of free-spinning
+        wait = IDLE_FRAME_TIME - (now - last_time)
+        if wait > 0:
+            time.sleep(wait)
+            now = time.monotonic()
     dt = now - last_time
     last_time = now
     if dt > 0.1: dt = 0.1
-    # update anim_t differently per mode
-    if animating:
-        if anim_mode == 'steps':
-            update_animation(dt)
-        elif anim_mode == 'snake':
-            # snake progress along path using anim_t
-            anim_t += 1.4 * dt
-            update_animation(0)  # let update_animation finish when needed
-        elif anim_mode == 'ladder':
-            anim_t += 2.2 * dt
-            update_animation(0)
+    # update_animation advances anim_t at the rate of each mode
+    update_animation(dt)
     glutPostRedisplay()
 
 def keyboard(key, x, y):
-    global last_roll, game_over, winner, animating, anim_path, anim_t, current_player, top_down, double_dice, theme_idx
+    global last_roll, game_over, winner, animating, anim_path, anim_t, current_player, top_down, double_dice, theme_idx, board_dirty
     k = key.decode("utf-8") if isinstance(key, bytes) else key
     if k in ('\x1b', 'q', 'Q'):
         sys.exit(0)
@@ -688,26 +813,29 @@ def keyboard(key, x, y):
         preview_dice()
     if k in ('t','T'):
         theme_idx = (theme_idx + 1) % len(THEMES)
+        board_dirty = True
+
+def build_hud_font():
+    # one display list per printable ASCII glyph, indexed by character code
+    global hud_font_base
+    hud_font_base = glGenLists(128)
+    for code in range(32, 127):
+        glNewList(hud_font_base + code, GL_COMPILE)
+        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, code)
+        glEndList()
 
 def draw_text(x, y, text, color=(1,1,1)):
+    # x, y in window pixels; no projection/modelview setup needed
     glColor3f(*color)
-    glRasterPos2f(x, y)
-    for ch in text:
-        glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+    glWindowPos2i(int(x), int(y))
+    glListBase(hud_font_base)
+    glCallLists(text.encode("ascii", "replace"))
+    glListBase(0)
 
 
 def draw_status_corner():
     global two_players
 
-    # Switch to 2D overlay
-    glMatrixMode(GL_PROJECTION)
-    glPushMatrix()
-    glLoadIdentity()
-    gluOrtho2D(0, W_WIDTH, 0, W_HEIGHT)
-    glMatrixMode(GL_MODELVIEW)
-    glPushMatrix()
-    glLoadIdentity()
-
     y = W_HEIGHT - 20
 
     # Always show Player 1
@@ -719,12 +847,6 @@ def draw_status_corner():
         msg2 = f"Blue (P2): {players[1]['pos']}"
         draw_text(10, y - 20, msg2, players[1]["color"])
 
-    # Restore matrices
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
-
 
 def reshape(w, h):
     global W_WIDTH, W_HEIGHT
@@ -745,18 +867,20 @@ def perform_roll_and_schedule():
     schedule_move(current_player, roll)
 
 def special(key, x, y):
-    global cam_angle, cam_tilt
+    global cam_angle, cam_tilt, cam_dirty
     if key == GLUT_KEY_LEFT: cam_angle += 4.0
     elif key == GLUT_KEY_RIGHT: cam_angle -= 4.0
     elif key == GLUT_KEY_UP: cam_tilt = clamp(cam_tilt + 3.0, -85.0, 85.0)
     elif key == GLUT_KEY_DOWN: cam_tilt = clamp(cam_tilt - 3.0, -85.0, 85.0)
+    cam_dirty = True
 
 def zoom(direction):
-    global cam_dist
+    global cam_dist, cam_dirty
     cam_dist = clamp(cam_dist + direction*0.8, 6.0, 40.0)
+    cam_dirty = True
 
 def restart_game():
-    global players, current_player, game_over, winner, animating, anim_path, anim_t, last_roll, anim_mode, double_dice
+    global players, current_player, game_over, winner, animating, anim_path, anim_t, last_roll, anim_mode, anim_dest_cell, double_dice
     for p in players:
         p["pos"] = 1
         p["skip"] = False
@@ -767,18 +891,22 @@ def restart_game():
     anim_path = []
     anim_t = 0.0
     anim_mode = None
+    anim_dest_cell = None
     last_roll = None
     double_dice = False
 
 def init_gl():
-    global quadric
     glClearColor(0.08, 0.10, 0.12, 1.0)
     glEnable(GL_DEPTH_TEST)
     glShadeModel(GL_SMOOTH)
     glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
     glEnable(GL_COLOR_MATERIAL)
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
+    init_cylinder_mesh()
+    init_pip_mesh()
+    init_snake_meshes()
+    build_cell_labels()
+    build_hud_font()
+    build_static_scene()
 
 def main():
     glutInit(sys.argv)